@@ -4,10 +4,14 @@
 from __future__ import annotations
 
 import argparse
+import os
+import sys
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Callable, Dict, Optional, Sequence
 
 from examples.run_orchestrated_discussion import build_controller, run_discussion
 from src.orchestrator.context_manager import ContextManager
@@ -32,6 +36,41 @@ DEFAULT_TURN_PLAN = textwrap.dedent(
 ).strip()
 
 
+_TOPIC_INTRO = textwrap.dedent(
+    """
+    You are participating in an asynchronous code review of a Python helper. Review the
+    function exactly as written (do not assume missing context) and follow the
+    turn-by-turn plan. Focus on correctness, defensive coding, and actionable guidance.
+    """
+).strip()
+
+_EXPECTATIONS = textwrap.dedent(
+    """
+    Expectations:
+    - Each turn must add a new insight or decision, avoiding duplication.
+    - Reference concrete behaviours (e.g., empty ranges, index bounds) when raising issues.
+    - Prefer concise bullet points when listing defects or next steps.
+    - Keep outputs under 220 words per turn.
+    """
+).strip()
+
+# Everything after the target block is fixed when the default plan is used.
+_DEFAULT_TOPIC_TAIL = f"\n\n{DEFAULT_TURN_PLAN}\n\n{_EXPECTATIONS}"
+
+_EMBED_TEMPLATE = (
+    "Target file `{display_path}` (you may also open `{reference_token}` directly in your CLI):\n"
+    "{code_block}"
+)
+_HYBRID_TEMPLATE = (
+    "Target file `{display_path}`. Open `{reference_token}` to inspect the full code.\n"
+    "{preview_header}\n"
+    "{preview_block}"
+)
+_REFERENCE_TEMPLATE = (
+    "Target file `{display_path}`. Open `{reference_token}` to review the complete implementation."
+)
+
+
 class InclusionStrategy(str, Enum):
     EMBED_FULL = "embed_full"
     HYBRID = "hybrid"
@@ -47,17 +86,42 @@ def _format_display_path(snippet_path: Path) -> str:
         return snippet_path.as_posix()
 
 
-def _render_code_block(lines: list[str]) -> str:
+@lru_cache(maxsize=32)
+def _load_snippet(path_str: str, mtime_ns: int) -> tuple[str, int]:
+    """Read a snippet once per (path, mtime) and return its stripped text and size."""
+
+    data = Path(path_str).read_bytes()
+    text = data.decode("utf-8").rstrip()
+    if "\r" in text:
+        # Match read_text()'s universal-newline handling.
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text, len(data)
+
+
+def _count_lines(text: str) -> int:
+    """Count lines without materializing them.
+
+    Only newline characters count as line breaks (the text is already
+    newline-normalized), matching how ``snippet_lines`` is split, so form feeds
+    and other characters that ``str.splitlines`` treats as separators stay
+    inside their line.
+    """
+
+    return text.count("\n") + 1 if text else 0
+
+
+def _render_code_block(lines: Sequence[str]) -> str:
     """Render lines as a Python code block with consistent indentation."""
 
     if lines:
-        formatted = textwrap.indent("\n".join(lines), "    ")
+        # Same output as textwrap.indent: whitespace-only lines are left untouched.
+        formatted = "\n".join(f"    {line}" if line.strip() else line for line in lines)
     else:
-        formatted = textwrap.indent("# (file is empty)", "    ")
+        formatted = "    # (file is empty)"
     return f"```python\n{formatted}\n```"
 
 
-def _render_preview_block(lines: list[str], preview_lines: int) -> tuple[str, bool]:
+def _render_preview_block(lines: Sequence[str], preview_lines: int) -> tuple[str, bool]:
     """Return a preview code block and whether it was truncated."""
 
     preview_limit = max(preview_lines, 1)
@@ -83,6 +147,65 @@ def determine_inclusion_strategy(
     return InclusionStrategy.EMBED_FULL
 
 
+def _render_embed(
+    display_path: str,
+    reference_token: str,
+    snippet_lines: Sequence[str],
+    preview_lines: int,
+) -> str:
+    """Render the target section with the full snippet embedded."""
+
+    return _EMBED_TEMPLATE.format(
+        display_path=display_path,
+        reference_token=reference_token,
+        code_block=_render_code_block(snippet_lines),
+    )
+
+
+def _render_hybrid(
+    display_path: str,
+    reference_token: str,
+    snippet_lines: Sequence[str],
+    preview_lines: int,
+) -> str:
+    """Render the target section with a truncated preview plus @-reference."""
+
+    total_lines = len(snippet_lines)
+    preview_block, truncated = _render_preview_block(snippet_lines, preview_lines)
+    preview_header = (
+        f"Preview (first {min(total_lines, max(preview_lines, 1))} of {total_lines} lines shown)."
+        if total_lines
+        else "Preview (file is empty)."
+    )
+    section = _HYBRID_TEMPLATE.format(
+        display_path=display_path,
+        reference_token=reference_token,
+        preview_header=preview_header,
+        preview_block=preview_block,
+    )
+    if truncated:
+        section += f"\n(Preview truncated after {max(preview_lines, 1)} of {total_lines} lines.)"
+    return section
+
+
+def _render_reference(
+    display_path: str,
+    reference_token: str,
+    snippet_lines: Sequence[str],
+    preview_lines: int,
+) -> str:
+    """Render the target section as an @-reference only."""
+
+    return _REFERENCE_TEMPLATE.format(display_path=display_path, reference_token=reference_token)
+
+
+_STRATEGY_RENDERERS: Dict[InclusionStrategy, Callable[[str, str, Sequence[str], int], str]] = {
+    InclusionStrategy.EMBED_FULL: _render_embed,
+    InclusionStrategy.HYBRID: _render_hybrid,
+    InclusionStrategy.REFERENCE_ONLY: _render_reference,
+}
+
+
 class ReviewContextManager(ContextManager):
     """Context manager that keeps the review scenario front-and-centre."""
 
@@ -101,7 +224,9 @@ class ReviewContextManager(ContextManager):
         lines = [
             f"{ai_name.title()}, you're co-reviewing the Python helper below.",
         ]
-        if not self.history:
+        # Each CLI session keeps its own transcript, so the static scenario only
+        # has to reach a participant once; later turns lean on that session context.
+        if ai_name not in self._last_turn_by_participant:
             lines.append(self._scenario)
         else:
             lines.append(
@@ -119,7 +244,7 @@ class ReviewContextManager(ContextManager):
 def build_topic(
     snippet_path: Path,
     turn_plan: str,
-    snippet_lines: list[str],
+    snippet_lines: Sequence[str],
     *,
     strategy: InclusionStrategy,
     preview_lines: int,
@@ -128,67 +253,12 @@ def build_topic(
 
     display_path = _format_display_path(snippet_path)
     reference_token = f"@{display_path}"
-    total_lines = len(snippet_lines)
-
-    sections: list[str] = [
-        textwrap.dedent(
-            """
-            You are participating in an asynchronous code review of a Python helper. Review the
-            function exactly as written (do not assume missing context) and follow the
-            turn-by-turn plan. Focus on correctness, defensive coding, and actionable guidance.
-            """
-        ).strip()
-    ]
-
-    if strategy is InclusionStrategy.EMBED_FULL:
-        sections.append(
-            textwrap.dedent(
-                f"""
-                Target file `{display_path}` (you may also open `{reference_token}` directly in your CLI):
-                {_render_code_block(snippet_lines)}
-                """
-            ).strip()
-        )
-    elif strategy is InclusionStrategy.HYBRID:
-        preview_block, truncated = _render_preview_block(snippet_lines, preview_lines)
-        preview_header = (
-            f"Preview (first {min(total_lines, max(preview_lines, 1))} of {total_lines} lines shown)."
-            if total_lines
-            else "Preview (file is empty)."
-        )
-        section = textwrap.dedent(
-            f"""
-            Target file `{display_path}`. Open `{reference_token}` to inspect the full code.
-            {preview_header}
-            {preview_block}
-            """
-        ).strip()
-        if truncated:
-            section += f"\n(Preview truncated after {max(preview_lines, 1)} of {total_lines} lines.)"
-        sections.append(section)
-    else:
-        sections.append(
-            textwrap.dedent(
-                f"""
-                Target file `{display_path}`. Open `{reference_token}` to review the complete implementation.
-                """
-            ).strip()
-        )
-
-    sections.append(turn_plan.strip())
-    sections.append(
-        textwrap.dedent(
-            """
-            Expectations:
-            - Each turn must add a new insight or decision, avoiding duplication.
-            - Reference concrete behaviours (e.g., empty ranges, index bounds) when raising issues.
-            - Prefer concise bullet points when listing defects or next steps.
-            - Keep outputs under 220 words per turn.
-            """
-        ).strip()
+    target = _STRATEGY_RENDERERS[strategy](
+        display_path, reference_token, snippet_lines, preview_lines
     )
-
-    return "\n\n".join(sections).strip()
+    if turn_plan is DEFAULT_TURN_PLAN:
+        return f"{_TOPIC_INTRO}\n\n{target}{_DEFAULT_TOPIC_TAIL}"
+    return "\n\n".join((_TOPIC_INTRO, target, turn_plan.strip(), _EXPECTATIONS))
 
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -363,16 +433,24 @@ def load_turn_plan(args: argparse.Namespace) -> str:
     return DEFAULT_TURN_PLAN
 
 
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of ``data`` to ``fd``, retrying after short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv)
 
-    if not args.snippet.exists():
-        raise SystemExit(f"Snippet file not found: {args.snippet}")
+    try:
+        snippet_stat = args.snippet.stat()
+    except FileNotFoundError:
+        raise SystemExit(f"Snippet file not found: {args.snippet}") from None
 
     turn_plan = load_turn_plan(args)
-    snippet_text = args.snippet.read_text(encoding="utf-8").rstrip()
-    snippet_lines = snippet_text.splitlines()
-    size_bytes = args.snippet.stat().st_size
+    snippet_text, size_bytes = _load_snippet(str(args.snippet), snippet_stat.st_mtime_ns)
+    line_count = _count_lines(snippet_text)
     preview_lines = max(args.preview_lines, 1)
     size_threshold = max(args.size_threshold, 1)
 
@@ -387,7 +465,7 @@ def main(argv: list[str] | None = None) -> int:
         )
 
     strategy = determine_inclusion_strategy(
-        line_count=len(snippet_lines),
+        line_count=line_count,
         size_bytes=size_bytes,
         embed_threshold=args.embed_threshold,
         reference_threshold=reference_threshold,
@@ -397,33 +475,50 @@ def main(argv: list[str] | None = None) -> int:
         "Using %s strategy for %s (lines=%d, bytes=%d)",
         strategy.value,
         _format_display_path(args.snippet),
-        len(snippet_lines),
+        line_count,
         size_bytes,
     )
-
-    claude = build_controller(
-        name="claude",
-        session_name=args.claude_session,
-        executable=args.claude_executable,
-        working_dir=args.claude_working_dir,
-        auto_start=args.auto_start,
-        startup_timeout=args.claude_startup_timeout,
-        init_wait=args.claude_init_wait,
-        bootstrap=args.claude_bootstrap,
-        kill_existing=args.kill_existing,
-    )
-
-    gemini = build_controller(
-        name="gemini",
-        session_name=args.gemini_session,
-        executable=args.gemini_executable,
-        working_dir=args.gemini_working_dir,
-        auto_start=args.auto_start,
-        startup_timeout=args.gemini_startup_timeout,
-        init_wait=args.gemini_init_wait,
-        bootstrap=args.gemini_bootstrap,
-        kill_existing=args.kill_existing,
-    )
+    # Reference-only prompts never show code, so skip splitting large files.
+    snippet_lines: tuple[str, ...] = (
+        ()
+        if strategy is InclusionStrategy.REFERENCE_ONLY
+        else tuple(snippet_text.split("\n") if snippet_text else ())
+    )
+
+    startup_specs = {
+        "claude": {
+            "agent_key": "claude",
+            "display_name": "Claude",
+            "session_name": args.claude_session,
+            "executable": args.claude_executable,
+            "working_dir": args.claude_working_dir,
+            "auto_start": args.auto_start,
+            "startup_timeout": args.claude_startup_timeout,
+            "init_wait": args.claude_init_wait,
+            "bootstrap": args.claude_bootstrap,
+            "kill_existing": args.kill_existing,
+        },
+        "gemini": {
+            "agent_key": "gemini",
+            "display_name": "Gemini",
+            "session_name": args.gemini_session,
+            "executable": args.gemini_executable,
+            "working_dir": args.gemini_working_dir,
+            "auto_start": args.auto_start,
+            "startup_timeout": args.gemini_startup_timeout,
+            "init_wait": args.gemini_init_wait,
+            "bootstrap": args.gemini_bootstrap,
+            "kill_existing": args.kill_existing,
+        },
+    }
+
+    # The two reviewers start in parallel so the review begins once the slower CLI is ready.
+    with ThreadPoolExecutor(max_workers=len(startup_specs)) as executor:
+        futures = {
+            name: executor.submit(build_controller, **spec)
+            for name, spec in startup_specs.items()
+        }
+        controllers = {name: future.result() for name, future in futures.items()}
 
     topic = build_topic(
         args.snippet,
@@ -437,38 +532,58 @@ def main(argv: list[str] | None = None) -> int:
     if args.debug_prompts:
         LOGGER.info("Prompt preview enabled (first %d characters)", args.prompt_preview_chars)
 
-    outcome: Dict[str, object] = run_discussion(
-        claude=claude,
-        gemini=gemini,
-        topic=topic,
-        max_turns=args.max_turns,
-        history_size=args.history_size,
-        start_with="claude",
-        debug_prompts=args.debug_prompts,
-        debug_prompt_chars=args.prompt_preview_chars,
-        include_history=args.include_history,
-        context_manager=review_context,
-    )
-
-    conversation = outcome["conversation"]
     log_path = args.log_file
-
+    log_fd = None
     if log_path:
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        with log_path.open("w", encoding="utf-8") as handle:
-            handle.write("=== CODE REVIEW SUMMARY ===\n")
-            for turn in conversation:
-                speaker = turn.get("speaker", "unknown")
-                handle.write(f"\n[{turn.get('turn', '?')}] {speaker.title()} says:\n")
-                handle.write(textwrap.indent((turn.get("response") or "(no response)").strip(), "    "))
-                handle.write("\n")
+        # Each turn is encoded once and written with a single syscall, so the
+        # transcript streams without going through the text/buffered layers.
+        log_fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    # ConversationManager only logs on_turn failures as warnings, so remember the
+    # first write error here and report it once the run is over.
+    log_error: Optional[OSError] = None
+
+    def write_log(data: bytes) -> None:
+        nonlocal log_error
+        if log_fd is None or log_error is not None:
+            return
+        try:
+            _write_all(log_fd, data)
+        except OSError as exc:
+            log_error = exc
 
+    write_log(b"=== CODE REVIEW SUMMARY ===\n")
     print("\n=== CODE REVIEW SUMMARY ===")
-    for turn in conversation:
-        speaker = turn.get("speaker", "unknown")
-        print(f"\n[{turn.get('turn', '?')}] {speaker.title()} says:")
-        print(textwrap.indent((turn.get("response") or "(no response)").strip(), "    "))
 
+    def emit_turn(turn: Dict[str, object]) -> None:
+        """Write each turn to the log and stdout as soon as it completes."""
+
+        speaker = str(turn.get("speaker", "unknown"))
+        body = textwrap.indent((turn.get("response") or "(no response)").strip(), "    ")
+        entry = f"\n[{turn.get('turn', '?')}] {speaker.title()} says:\n{body}\n"
+        sys.stdout.write(entry)
+        write_log(entry.encode("utf-8"))
+
+    try:
+        run_discussion(
+            controllers=controllers,
+            topic=topic,
+            max_turns=args.max_turns,
+            history_size=args.history_size,
+            start_with="claude",
+            debug_prompts=args.debug_prompts,
+            debug_prompt_chars=args.prompt_preview_chars,
+            include_history=args.include_history,
+            context_manager=review_context,
+            on_turn=emit_turn,
+        )
+    finally:
+        if log_fd is not None:
+            os.close(log_fd)
+
+    if log_error is not None:
+        print(f"[error] Failed to write transcript to {log_path}: {log_error}", file=sys.stderr)
+        return 1
     if log_path:
         print(f"\nRun complete. Transcript saved to {log_path}.")
     else:
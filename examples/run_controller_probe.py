@@ -11,9 +11,11 @@ submit key, timing delays, ready indicators).
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 import time
-from typing import Callable, Dict, List, Optional, Type
+from types import MappingProxyType
+from typing import Callable, List, Mapping, Optional, Type
 
 from src.controllers.claude_controller import ClaudeController
 from src.controllers.codex_controller import CodexController
@@ -24,11 +26,13 @@ from src.utils.output_parser import OutputParser
 ControllerFactory = Callable[..., object]
 
 
-CONTROLLERS: Dict[str, Type] = {
-    "claude": ClaudeController,
-    "gemini": GeminiController,
-    "codex": CodexController,
-}
+CONTROLLERS: Mapping[str, Type] = MappingProxyType(
+    {
+        "claude": ClaudeController,
+        "gemini": GeminiController,
+        "codex": CodexController,
+    }
+)
 
 
 def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
@@ -41,7 +45,7 @@ def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
     )
     parser.add_argument(
         "--controller",
-        choices=CONTROLLERS.keys(),
+        choices=tuple(CONTROLLERS),
         required=True,
         help="Controller to exercise.",
     )
@@ -94,13 +98,57 @@ def capture_scrollback_lines(controller: object) -> List[str]:
     return []
 
 
+def scrollback_mark(controller: object) -> Optional[int]:
+    """
+    Return the controller's pane history length, or None when unsupported.
+
+    None also covers a history saturated at tmux's history-limit, where the
+    length no longer tracks newly scrolled lines.
+    """
+    length = getattr(controller, "scrollback_length", None)
+    if callable(length):
+        try:
+            value = length()
+        except Exception:  # noqa: BLE001
+            return None
+        return None if value is None else int(value)
+    return None
+
+
+def capture_lines_since(
+    controller: object,
+    mark: Optional[int],
+    current: Optional[int] = None,
+) -> List[str]:
+    """
+    Capture only the pane region that may have changed since ``mark``.
+
+    The capture starts at the first line that was visible when ``mark`` was
+    taken, so it stays bounded by the pane height plus newly scrolled lines.
+    Pass ``current`` when the history length is already known (e.g., the
+    capture right after taking ``mark``) to skip querying it again. Falls back
+    to the full scrollback when the controller cannot report its history
+    length, the history is saturated, or it shrank (e.g., the pane was cleared).
+    """
+    if current is None and mark is not None:
+        current = scrollback_mark(controller)
+    capture = getattr(controller, "capture_output", None)
+    if mark is None or current is None or current < mark or not callable(capture):
+        return capture_scrollback_lines(controller)
+    try:
+        return capture(start_line=mark - current).splitlines()
+    except Exception:  # noqa: BLE001
+        return capture_scrollback_lines(controller)
+
+
 def compute_delta(previous: List[str], current: List[str], tail_limit: Optional[int]) -> List[str]:
     if previous and len(current) >= len(previous):
-        limit = min(len(previous), len(current))
-        prefix = 0
-        while prefix < limit and previous[prefix] == current[prefix]:
-            prefix += 1
-        delta = current[prefix:]
+        # Newline-terminate every line so the shared character prefix ends on a
+        # line boundary; counting its newlines gives the matching line count.
+        common = os.path.commonprefix(
+            ["\n".join(previous) + "\n", "\n".join(current) + "\n"]
+        )
+        delta = current[common.count("\n"):]
     else:
         delta = current
 
@@ -128,22 +176,24 @@ def main(argv: List[str] | None = None) -> int:
             print("[info] Session already running; reusing existing instance.")
         else:
             print("[info] Starting session...")
+            # start_session() already blocks on the ready indicator and the
+            # configured stabilization delay, so no extra sleep is needed.
             controller.start_session()
-            time.sleep(1.0)
 
     controller.reset_output_cache()
     parser = OutputParser()
 
     for idx, prompt in enumerate(args.prompts, start=1):
         print(f"[turn {idx}] prompt: {prompt}")
-        before_lines = capture_scrollback_lines(controller)
+        mark = scrollback_mark(controller)
+        before_lines = capture_lines_since(controller, mark, current=mark)
         controller.send_command(prompt)
         if controller.wait_for_ready(timeout=args.response_timeout):
             print("  [status] response complete")
         else:
             print("  [status] timeout waiting for response")
 
-        after_lines = capture_scrollback_lines(controller)
+        after_lines = capture_lines_since(controller, mark)
         delta_lines = compute_delta(before_lines, after_lines, args.tail_lines)
         if delta_lines:
             raw_delta = "\n".join(delta_lines)
@@ -9,11 +9,13 @@ The script records the transcript and verifies that every number appears in orde
 from __future__ import annotations
 
 import argparse
-import re
 import time
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import suppress
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from src.controllers.tmux_controller import SessionBackendError, SessionNotFoundError, TmuxController
 from src.orchestrator import ContextManager, DevelopmentTeamOrchestrator, MessageRouter
@@ -22,6 +24,20 @@ from src.utils.config_loader import get_config
 from src.utils.output_parser import OutputParser
 
 
+_TURN_PROMPT = (
+    "Current number: {number}\n"
+    "Reply using exactly two lines:\n"
+    "Line 1: {number}\n"
+    "Line 2: Next speaker ({next_speaker}) should reply with {next_target}.\n"
+    "Do not open files, run commands, or use tools. No additional commentary or formatting."
+)
+_COUNTING_PROMPT = (
+    "You are counting upward with {next_speaker}. Respond with ONLY the number {number}."
+    " Then instruct {next_speaker} to add 1 and reply with the next number."
+    " Do not add extra commentary."
+)
+
+
 def build_controller(
     *,
     name: str,
@@ -47,7 +63,8 @@ def build_controller(
         ai_config=base,
         executable_args=tuple(parts[1:]),
     )
-    controller.reset_output_cache()
+    # A new controller starts with an empty output cache, and send_command()
+    # snapshots the pane before each prompt, so no reset_output_cache() is needed here.
 
     if kill_existing and controller.session_exists():
         controller.kill()
@@ -124,7 +141,7 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         "--turn-delay",
         type=float,
         default=1.0,
-        help="Seconds to pause before dispatching each prompt (default 1.0).",
+        help="Minimum seconds between prompt dispatches (default 1.0).",
     )
     parser.add_argument(
         "--initial-delay",
@@ -138,38 +155,103 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         default=30.0,
         help="Seconds to wait for each AI response before giving up (default 30s).",
     )
+    parser.add_argument(
+        "--retry-on-empty",
+        action="store_true",
+        help="Ask the controller for its last output when a turn's capture shows no change.",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print raw, cleaned, and parsed output for every turn.",
+    )
     return parser.parse_args(argv)
 
 
-def capture_scrollback_lines(controller: TmuxController) -> List[str]:
+def capture_scrollback_text(controller: TmuxController) -> str:
     try:
-        snapshot = controller.capture_scrollback()
+        return controller.capture_scrollback()
     except (SessionBackendError, SessionNotFoundError):
-        return []
-    return snapshot.splitlines()
+        return ""
+
+
+def scrollback_mark(controller: TmuxController) -> Optional[int]:
+    """
+    Return the pane history length, or None when it cannot be used as a mark.
+
+    None covers both tmux failures and a history saturated at history-limit,
+    where trimming stops the length from tracking newly scrolled lines.
+    """
+    try:
+        return controller.scrollback_length()
+    except (SessionBackendError, SessionNotFoundError):
+        return None
+
+
+def capture_text_since(controller: TmuxController, mark: Optional[int]) -> Tuple[str, Optional[int]]:
+    """
+    Capture only the pane region that may have changed since ``mark``.
+
+    The capture starts at the first line that was visible when ``mark`` was
+    taken, so each turn copies the pane plus newly scrolled lines instead of the
+    whole history. Falls back to the full scrollback when no mark is available,
+    the history reached tmux's history-limit (old lines are trimmed, so offsets
+    stop lining up), or the history shrank (e.g., the pane was cleared).
+
+    Returns:
+        The captured text and the history length observed for this capture
+        (None when the full scrollback was used).
+    """
+    current = scrollback_mark(controller) if mark is not None else None
+    if mark is None or current is None or current < mark:
+        return capture_scrollback_text(controller), None
+    try:
+        return controller.capture_output(start_line=mark - current), current
+    except (SessionBackendError, SessionNotFoundError):
+        return capture_scrollback_text(controller), None
+
+
+def drop_leading_lines(text: str, count: int) -> str:
+    """Return ``text`` without its first ``count`` lines."""
+    start = 0
+    for _ in range(count):
+        start = text.find("\n", start) + 1
+        if not start:
+            return ""
+    return text[start:]
+
+
+def _first_int(text: str) -> Optional[int]:
+    """Return the first run of decimal digits in ``text`` as an int, if any."""
+    start = 0
+    length = len(text)
+    while start < length and not text[start].isdecimal():
+        start += 1
+    end = start
+    while end < length and text[end].isdecimal():
+        end += 1
+    return int(text[start:end]) if end > start else None
 
 
 def compute_delta(previous: List[str], current: List[str], tail_limit: int) -> List[str]:
+    prefix = 0
     if previous and len(current) >= len(previous):
-        limit = min(len(previous), len(current))
-        prefix = 0
-        while prefix < limit and previous[prefix] == current[prefix]:
-            prefix += 1
-        delta = current[prefix:]
-    else:
-        delta = current
+        prefix = len(previous)
+        # Scrollback usually only grows, so confirm the whole prefix with one
+        # list comparison and walk line by line only when something changed.
+        if current[:prefix] != previous:
+            prefix = 0
+            while previous[prefix] == current[prefix]:
+                prefix += 1
 
-    if tail_limit and len(delta) > tail_limit:
-        delta = delta[-tail_limit:]
-    return delta
+    # Apply the tail limit in the same slice so the dropped head is never copied.
+    if tail_limit:
+        prefix = max(prefix, len(current) - tail_limit)
+    return current[prefix:]
 
 
 def build_prompt(number: int, speaker: str, next_speaker: str) -> str:
-    return (
-        f"You are counting upward with {next_speaker}. Respond with ONLY the number {number}."
-        f" Then instruct {next_speaker} to add 1 and reply with the next number."
-        " Do not add extra commentary."
-    )
+    return _COUNTING_PROMPT.format(number=number, next_speaker=next_speaker)
 
 
 def main(argv: list[str]) -> int:
@@ -177,8 +259,8 @@ def main(argv: list[str]) -> int:
     transcript_path = Path(args.log_file) if args.log_file else None
     parser = OutputParser()
 
-    try:
-        claude = build_controller(
+    startup_specs = {
+        "claude": dict(
             name="Claude",
             session_name=args.claude_session,
             executable=args.claude_executable,
@@ -187,8 +269,8 @@ def main(argv: list[str]) -> int:
             startup_timeout=args.claude_startup_timeout,
             init_wait=args.claude_init_wait,
             kill_existing=args.kill_existing,
-        )
-        gemini = build_controller(
+        ),
+        "gemini": dict(
             name="Gemini",
             session_name=args.gemini_session,
             executable=args.gemini_executable,
@@ -197,8 +279,8 @@ def main(argv: list[str]) -> int:
             startup_timeout=args.gemini_startup_timeout,
             init_wait=args.gemini_init_wait,
             kill_existing=args.kill_existing,
-        )
-        codex = build_controller(
+        ),
+        "codex": dict(
             name="Codex",
             session_name=args.codex_session,
             executable=args.codex_executable,
@@ -207,12 +289,42 @@ def main(argv: list[str]) -> int:
             startup_timeout=args.codex_startup_timeout,
             init_wait=args.codex_init_wait,
             kill_existing=args.kill_existing,
-        )
-    except (SessionBackendError, SessionNotFoundError) as exc:
-        print(f"[error] {exc}", file=sys.stderr)
+        ),
+    }
+
+    # The three counters boot independently, so the count can start once the
+    # slowest one is ready instead of after each in turn.
+    controllers: Dict[str, TmuxController] = {}
+    errors: List[Exception] = []
+    with ThreadPoolExecutor(max_workers=len(startup_specs)) as executor:
+        future_names = {
+            executor.submit(build_controller, **spec): name
+            for name, spec in startup_specs.items()
+        }
+        for future in as_completed(future_names):
+            if future.cancelled():
+                continue
+            try:
+                controllers[future_names[future]] = future.result()
+            except (SessionBackendError, SessionNotFoundError) as exc:
+                errors.append(exc)
+                # Stop like the sequential startup did: skip startups not yet begun.
+                for pending in future_names:
+                    pending.cancel()
+
+    if errors:
+        for exc in errors:
+            print(f"[error] {exc}", file=sys.stderr)
+        # Sessions only get launched under --auto-start; tear those down again
+        # rather than leaving them running after an aborted startup.
+        if args.auto_start:
+            for name, controller in controllers.items():
+                with suppress(SessionBackendError, SessionNotFoundError):
+                    controller.kill()
+                    print(f"[info] Stopped {name} session '{controller.session_name}'.")
         return 1
+    controllers = {name: controllers[name] for name in startup_specs}
 
-    controllers: Dict[str, TmuxController] = {"claude": claude, "gemini": gemini, "codex": codex}
     orchestrator = DevelopmentTeamOrchestrator(controllers)
     context_manager = ContextManager(history_size=args.history_size)
     router = MessageRouter(["claude", "gemini", "codex"], context_manager=context_manager)
@@ -224,91 +336,131 @@ def main(argv: list[str]) -> int:
         max_history=args.history_size,
     )
 
-    conversation = []
+    # Only the most recent turns are kept; the transcript file preserves the full run.
+    conversation: Deque[Dict[str, Any]] = deque(maxlen=max(args.history_size, 1))
+    turn_index = 0
     if args.initial_delay > 0:
         print(f"[info] Waiting {args.initial_delay:.1f}s before starting the count...")
         time.sleep(args.initial_delay)
 
     turn_delay = max(0.0, args.turn_delay)
     next_number = 1
-    current_speaker_index = 0  # 0 -> claude, 1 -> gemini
-    transcript_lines: list[str] = []
-
-    while next_number <= args.count_to:
-        speaker = manager.participants[current_speaker_index]
-        next_speaker = manager.participants[(current_speaker_index + 1) % len(manager.participants)]
-        next_target = next_number + 1
-        prompt_lines = [
-            f"Current number: {next_number}",
-            f"Reply using exactly two lines:",
-            f"Line 1: {next_number}",
-            f"Line 2: Next speaker ({next_speaker}) should reply with {next_target}.",
-            "Do not open files, run commands, or use tools. No additional commentary or formatting.",
-        ]
-        prompt = "\n".join(prompt_lines)
-
-        if turn_delay:
-            time.sleep(turn_delay)
-
-        controller = controllers[speaker]
-        before_lines = capture_scrollback_lines(controller)
-        dispatch = orchestrator.dispatch_command(speaker, prompt)
-        controller.wait_for_ready(timeout=max(int(args.response_timeout), 1))
-        after_lines = capture_scrollback_lines(controller)
-        delta_lines = compute_delta(before_lines, after_lines, tail_limit=300)
-        if delta_lines:
-            raw_output = "\n".join(delta_lines)
-        else:
-            fallback = controller.get_last_output(tail_lines=300)
-            raw_output = fallback or ""
-
-        cleaned_output = parser.clean_output(raw_output, strip_trailing_prompts=True)
-        pairs = parser.extract_responses(raw_output) or parser.extract_responses(cleaned_output)
-        response = pairs[-1]["response"].strip() if pairs else cleaned_output.strip() or raw_output.strip()
-        reported_number: Optional[int] = None
-        if response:
-            numbers = re.findall(r"\d+", response)
-            if numbers:
-                reported_number = int(numbers[0])
-
-        turn_record = {
-            "turn": len(conversation),
-            "speaker": speaker,
-            "prompt": prompt,
-            "response": response,
-            "metadata": dispatch,
-        }
-        conversation.append(turn_record)
-        transcript_lines.append(f"{next_number}: {speaker}: {response}")
-
-        print(f"[debug] Raw output from {speaker}:\n{raw_output}\n---")
-        if cleaned_output:
-            print(f"[debug] Cleaned output from {speaker}:\n{cleaned_output}\n---")
-        if pairs:
-            print(f"[debug] Parsed response from {speaker}: {pairs[-1]['response']}\n---")
-
-        if not response:
-            print(f"[warn] No response captured for turn {len(conversation)-1} ({speaker}).")
-            break
-
-        # Update number by parsing the response's first integer.
-        if reported_number is None:
-            print(f"[warn] Could not parse number from {speaker}'s response: {response!r}")
-            break
-
-        if reported_number != next_number:
-            print(f"[warn] Expected {next_number} but {speaker} replied with {reported_number}.")
-            break
+    current_speaker_index = 0  # 0 -> claude, 1 -> gemini, 2 -> codex
+    preview: Deque[str] = deque(maxlen=10)
+    participants = tuple(manager.participants)
+    participant_count = len(participants)
+    next_participants = participants[1:] + participants[:1]
+    participant_controllers = tuple(controllers[name] for name in participants)
+    next_dispatch = time.monotonic()
+    # Each speaker's post-turn capture, re-based to the history length seen at
+    # that time, doubles as its pre-dispatch capture on its next turn. Nothing
+    # else writes to the panes in between, so this saves a capture per turn.
+    # A saturated history reports no mark, which drops the cache and resyncs
+    # that speaker with full captures from then on.
+    last_capture: Dict[str, Tuple[int, str]] = {}
+
+    # Stream the transcript so an interrupted run still leaves every finished turn on disk.
+    transcript_handle = (
+        transcript_path.open("w", encoding="utf-8", buffering=64 * 1024) if transcript_path else None
+    )
+    try:
+        while next_number <= args.count_to:
+            speaker = participants[current_speaker_index]
+            next_speaker = next_participants[current_speaker_index]
+            prompt = _TURN_PROMPT.format(
+                number=next_number,
+                next_speaker=next_speaker,
+                next_target=next_number + 1,
+            )
 
-        next_number += 1
-        current_speaker_index = (current_speaker_index + 1) % len(manager.participants)
+            # Rate-limit dispatches; a turn that already took turn_delay waits no longer.
+            remaining = next_dispatch - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            next_dispatch = time.monotonic() + turn_delay
+
+            controller = participant_controllers[current_speaker_index]
+            cached = last_capture.pop(speaker, None)
+            if cached is not None:
+                mark, before_text = cached
+            else:
+                mark = scrollback_mark(controller)
+                before_text, _ = capture_text_since(controller, mark)
+            dispatch = orchestrator.dispatch_command(speaker, prompt)
+            controller.wait_for_ready(timeout=max(int(args.response_timeout), 1))
+            after_text, after_mark = capture_text_since(controller, mark)
+            if mark is not None and after_mark is not None:
+                last_capture[speaker] = (
+                    after_mark,
+                    drop_leading_lines(after_text, after_mark - mark),
+                )
+            # An unchanged capture has no delta; only split snapshots that differ.
+            delta_lines = (
+                compute_delta(before_text.splitlines(), after_text.splitlines(), tail_limit=300)
+                if after_text != before_text
+                else []
+            )
+            raw_output = "\n".join(delta_lines)
+            if not raw_output:
+                if not args.retry_on_empty:
+                    print(f"[warn] No new output from {speaker} for turn {turn_index}.")
+                    break
+                raw_output = controller.get_last_output(tail_lines=300) or ""
+
+            # Cleaning is only needed when the raw capture has no parsable response.
+            cleaned_output = ""
+            pairs = parser.extract_responses(raw_output)
+            if not pairs:
+                cleaned_output = parser.clean_output(raw_output, strip_trailing_prompts=True)
+                pairs = parser.extract_responses(cleaned_output)
+            response = pairs[-1]["response"].strip() if pairs else cleaned_output.strip() or raw_output.strip()
+            reported_number = _first_int(response)
+
+            turn_record = {
+                "turn": turn_index,
+                "speaker": speaker,
+                "prompt": prompt,
+                "response": response,
+                "metadata": dispatch,
+            }
+            conversation.append(turn_record)
+            turn_index += 1
+            transcript_line = f"{next_number}: {speaker}: {response}"
+            preview.append(transcript_line)
+            if transcript_handle is not None:
+                transcript_handle.write(transcript_line + "\n")
+
+            if args.verbose:
+                print(f"[debug] Raw output from {speaker}:\n{raw_output}\n---")
+                if cleaned_output:
+                    print(f"[debug] Cleaned output from {speaker}:\n{cleaned_output}\n---")
+                if pairs:
+                    print(f"[debug] Parsed response from {speaker}: {pairs[-1]['response']}\n---")
+
+            if not response:
+                print(f"[warn] No response captured for turn {turn_index - 1} ({speaker}).")
+                break
+
+            # Update number by parsing the response's first integer.
+            if reported_number is None:
+                print(f"[warn] Could not parse number from {speaker}'s response: {response!r}")
+                break
+
+            if reported_number != next_number:
+                print(f"[warn] Expected {next_number} but {speaker} replied with {reported_number}.")
+                break
+
+            next_number += 1
+            current_speaker_index = (current_speaker_index + 1) % participant_count
+    finally:
+        if transcript_handle is not None:
+            transcript_handle.close()
 
     if transcript_path:
-        transcript_path.write_text("\n".join(transcript_lines), encoding="utf-8")
         print(f"\nTranscript written to {transcript_path}")
 
     print("=== Transcript Preview ===")
-    for line in transcript_lines[-10:]:
+    for line in preview:
         print(line)
 
     return 0
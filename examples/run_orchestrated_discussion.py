@@ -12,12 +12,15 @@ and prints a concise turn-by-turn summary.
 from __future__ import annotations
 
 import argparse
+import json
 import sys
-import textwrap
 import shlex
+from collections import ChainMap
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
-from typing import Dict, Optional, Sequence
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Sequence, TextIO
 
 from src.controllers import (
     ClaudeController,
@@ -28,9 +31,11 @@ from src.controllers import (
 )
 from src.controllers.session_backend import SessionSpec
 from src.controllers.tmux_controller import SessionBackendError, SessionNotFoundError
-from src.orchestrator import ContextManager, DevelopmentTeamOrchestrator, MessageRouter
 from src.utils.config_loader import get_config
 
+if TYPE_CHECKING:
+    from src.orchestrator import ContextManager, MessageRouter
+
 logger = logging.getLogger(__name__)
 
 AGENT_ORDER = ("claude", "gemini", "codex", "qwen")
@@ -47,6 +52,9 @@ _STARTUP_TIMEOUT_FALLBACKS = {
     "qwen": 25,
 }
 
+# Turn metadata flags surfaced next to the speaker, in display order.
+_STATUS_KEYS = ("queued", "consensus", "conflict")
+
 CONTROLLER_REGISTRY = {
     "claude": ClaudeController,
     "gemini": GeminiController,
@@ -61,6 +69,7 @@ def build_controller(
     display_name: str,
     session_name: str,
     executable: str,
+    executable_parts: Sequence[str] | None = None,
     working_dir: str | None,
     auto_start: bool,
     startup_timeout: int,
@@ -78,18 +87,22 @@ def build_controller(
         working_dir=working_dir,
     )
 
-    # Work on a copy so downstream tweaks don't mutate the global config loader.
-    controller.config = dict(controller.config)
-
-    # Apply runtime overrides to the controller configuration
-    controller.config["startup_timeout"] = startup_timeout
+    # Apply runtime overrides in a layer above the loaded config so neither the
+    # global config loader nor later tweaks to this controller touch each other.
+    overrides: Dict[str, object] = {
+        "startup_timeout": startup_timeout,
+        "pause_on_manual_clients": False,
+    }
+    if init_wait is not None:
+        overrides["init_wait"] = init_wait
+    controller.config = ChainMap(overrides, controller.config)
     controller.startup_timeout = startup_timeout
-    controller.config["pause_on_manual_clients"] = False
     controller._pause_on_manual_clients = False  # pylint: disable=protected-access
-    if init_wait is not None:
-        controller.config["init_wait"] = init_wait
 
-    exe_parts = shlex.split(executable)
+    # executable_parts is the caller's pre-split form of executable and must be
+    # derived from it: the direct launch uses the parts, while a bootstrap hands
+    # the raw string to bash.
+    exe_parts = shlex.split(executable) if executable_parts is None else executable_parts
     if not exe_parts:
         raise ValueError(f"No executable provided for {display_name}")
 
@@ -97,6 +110,8 @@ def build_controller(
     launch_args = exe_parts[1:]
 
     if bootstrap:
+        # Hand bash the executable as written so $VARS, ~, shell functions and
+        # compound commands set up by the bootstrap keep working.
         shell_command = f"{bootstrap} && {executable}"
         launch_executable = "bash"
         launch_args = ["-lc", shell_command]
@@ -112,13 +127,15 @@ def build_controller(
 
     controller.reset_output_cache()
 
-    if kill_existing and controller.session_exists():
+    session_present = controller.session_exists()
+    if kill_existing and session_present:
         if not controller.kill_session():
             raise SessionBackendError(
                 f"Failed to kill existing tmux session '{session_name}' for {display_name}."
             )
+        session_present = False
 
-    if controller.session_exists():
+    if session_present:
         controller.resume_automation(flush_pending=True)
         return controller
 
@@ -146,7 +163,11 @@ def run_discussion(
     context_manager: ContextManager | None = None,
     message_router: MessageRouter | None = None,
     participants: Optional[Sequence[str]] = None,
+    on_turn: Optional[Callable[[Dict[str, object]], None]] = None,
 ) -> Dict[str, object]:
+    # Imported here so --help and startup failures skip loading the orchestrator package.
+    from src.orchestrator import ContextManager, DevelopmentTeamOrchestrator, MessageRouter
+
     orchestrator = DevelopmentTeamOrchestrator(controllers)
     if debug_prompts:
         orchestrator.set_prompt_debug(True, preview_chars=debug_prompt_chars)
@@ -169,7 +190,8 @@ def run_discussion(
         raise ValueError(f"Unknown --start-with value '{start_with}'.")
     if start_key in participants:
         start_idx = participants.index(start_key)
-        participants = participants[start_idx:] + participants[:start_idx]
+        if start_idx:
+            participants = participants[start_idx:] + participants[:start_idx]
 
     router = message_router or MessageRouter(participants, context_manager=context_manager)
 
@@ -180,6 +202,7 @@ def run_discussion(
         message_router=router,
         participants=participants,
         include_history=include_history,
+        on_turn=on_turn,
     )
     return {
         "conversation": result["conversation"],
@@ -188,31 +211,27 @@ def run_discussion(
     }
 
 
+def _indent(text: str, prefix: str = "    ") -> str:
+    """Prefix non-blank lines, leaving blank lines empty like textwrap.indent."""
+    return "\n".join(f"{prefix}{line}" if line.strip() else line for line in text.split("\n"))
+
+
 def format_turn(turn: Dict[str, object]) -> str:
-    speaker = turn.get("speaker", "unknown")
-    prompt = (turn.get("prompt") or "").strip()
-    response = (turn.get("response") or "").strip()
-    metadata = turn.get("metadata") or {}
-    status_bits = []
-    if metadata.get("queued"):
-        status_bits.append("queued")
-    if metadata.get("consensus"):
-        status_bits.append("consensus")
-    if metadata.get("conflict"):
-        status_bits.append("conflict")
+    get = turn.get
+    speaker = get("speaker", "unknown")
+    prompt = (get("prompt") or "").strip()
+    response = (get("response") or "").strip()
+    metadata = get("metadata") or {}
+    status_bits = [key for key in _STATUS_KEYS if metadata.get(key)]
     status_suffix = f" [{' '.join(status_bits)}]" if status_bits else ""
 
-    prompt_block = textwrap.indent(prompt, "    ")
-    response_block = textwrap.indent(response, "    ") if response else "    (no response captured yet)"
-
-    return "\n".join(
-        [
-            f"{turn.get('turn')}: {speaker}{status_suffix}",
-            "  Prompt:",
-            prompt_block,
-            "  Response:",
-            response_block,
-        ]
+    prompt_block = _indent(prompt)
+    response_block = _indent(response) if response else "    (no response captured yet)"
+
+    return (
+        f"{get('turn')}: {speaker}{status_suffix}\n"
+        f"  Prompt:\n{prompt_block}\n"
+        f"  Response:\n{response_block}"
     )
 
 
@@ -281,7 +300,20 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     parser.add_argument(
         "--log-file",
         default=None,
-        help="Optional path to write the conversation transcript and summary.",
+        help=(
+            "Optional path to write the conversation transcript and summary. "
+            "An existing directory gets a discussion.log inside it."
+        ),
+    )
+    parser.add_argument(
+        "--save-context",
+        default=None,
+        help="Optional path to save the shared context history (JSON) after the discussion.",
+    )
+    parser.add_argument(
+        "--resume-context",
+        default=None,
+        help="Seed the shared context with history saved by --save-context from an earlier run.",
     )
     parser.add_argument(
         "--kill-existing",
@@ -351,7 +383,10 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         parser.add_argument(
             f"--{agent}-bootstrap",
             default=None,
-            help=f"Command to run before launching the {display} executable.",
+            help=(
+                f"Command to run before launching the {display} executable. Both run "
+                "in one bash -lc shell, so the executable may use variables it sets."
+            ),
         )
         parser.add_argument(
             f"--{agent}-cwd",
@@ -378,24 +413,101 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
             if getattr(args, field) == parser.get_default(field):
                 setattr(args, field, override)
 
+    # Tokenize each selected executable once so controller builds reuse the
+    # parts; unselected agents' executables are never launched, so skip them.
+    for agent in AGENT_ORDER if "all" in args.agents else dict.fromkeys(args.agents):
+        try:
+            parts = tuple(shlex.split(getattr(args, f"{agent}_executable")))
+        except ValueError as exc:
+            parser.error(f"--{agent}-executable: {exc}")
+        setattr(args, f"{agent}_executable_parts", parts)
+
     return args
 
 
+def _as_sentence(prompt: str) -> str:
+    """Ensure ``prompt`` ends a sentence so it stays distinct once joined."""
+    text = " ".join(prompt.split())
+    if not text or text.endswith((".", "!", "?")):
+        return text
+    # Keep the period clear of a trailing @file reference so the path survives.
+    if text.rsplit(" ", 1)[-1].startswith("@"):
+        return f"{text} ."
+    return f"{text}."
+
+
+def deliver_system_prompts(name: str, controller: TmuxController, prompts: Sequence[str]) -> None:
+    """Send pre-discussion prompts to one controller as a single combined message."""
+    if not prompts:
+        return
+    logger.info("Sending %d pre-discussion system prompt(s) to %s", len(prompts), name)
+    # One submission keeps the prompts in order while paying for a single
+    # readiness wait; the timeout still scales with the number of prompts.
+    # send_command collapses newlines into spaces, so when several prompts
+    # share a submission each one is closed as a sentence before joining.
+    if len(prompts) == 1:
+        combined = prompts[0]
+    else:
+        combined = " ".join(filter(None, (_as_sentence(prompt) for prompt in prompts)))
+    controller.send_command(combined)
+    controller.wait_for_ready(timeout=30 * len(prompts))
+
+
+def load_context(path: Path, history_size: int) -> ContextManager:
+    """Return a ContextManager seeded with turns saved by ``save_context``."""
+    from src.orchestrator import ContextManager
+
+    context_manager = ContextManager(history_size=history_size)
+    turns = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(turns, list):
+        raise ValueError("expected a JSON list of turns")
+    for turn in turns:
+        if not isinstance(turn, dict):
+            continue
+        # Turn numbers restart every run; dropping them keeps earlier turns visible
+        # to every speaker instead of being filtered as already-seen history.
+        turn.pop("turn", None)
+        context_manager.record_turn(turn)
+    return context_manager
+
+
+def save_context(context_manager: ContextManager, path: Path) -> None:
+    """Write the context history to ``path`` as JSON for a later --resume-context."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(context_manager.history, indent=2, default=str),
+        encoding="utf-8",
+    )
+
+
 def cleanup_controller(controller: Optional[TmuxController], label: str) -> None:
     if controller is None:
         return
 
+    # kill() only probes has-session when kill-session fails, so a live session
+    # costs one tmux call and an already-gone one is skipped quietly.
     try:
-        if controller.session_exists():
-            if controller.kill_session():
-                print(f"[cleanup] Killed {label} session '{controller.session_name}'.")
-            else:
-                print(
-                    f"[cleanup] Unable to kill {label} session '{controller.session_name}'.",
-                    file=sys.stderr,
-                )
-    except (SessionNotFoundError, SessionBackendError) as exc:
-        print(f"[cleanup] Error while killing {label} session: {exc}", file=sys.stderr)
+        controller.kill()
+    except SessionNotFoundError:
+        return
+    except SessionBackendError as exc:
+        print(
+            f"[cleanup] Unable to kill {label} session '{controller.session_name}': {exc}",
+            file=sys.stderr,
+        )
+        return
+    print(f"[cleanup] Killed {label} session '{controller.session_name}'.")
+
+
+def cleanup_controllers(controllers: Dict[str, TmuxController]) -> None:
+    """Kill every controller's session concurrently; each kill is an independent tmux call."""
+    if not controllers:
+        return
+
+    labels = [AGENT_DISPLAY_NAMES.get(agent, agent) for agent in controllers]
+    with ThreadPoolExecutor(max_workers=len(controllers)) as executor:
+        # Consume the results so unexpected errors still propagate.
+        list(executor.map(cleanup_controller, controllers.values(), labels))
 
 
 def main(argv: list[str]) -> int:
@@ -413,12 +525,7 @@ def main(argv: list[str]) -> int:
     if "all" in args.agents:
         selected_agents = list(AGENT_ORDER)
     else:
-        seen = set()
-        selected_agents = []
-        for agent in args.agents:
-            if agent not in seen:
-                selected_agents.append(agent)
-                seen.add(agent)
+        selected_agents = list(dict.fromkeys(args.agents))
 
     if not selected_agents:
         print("[error] No agents selected. Use --agents to specify at least one CLI.", file=sys.stderr)
@@ -434,16 +541,31 @@ def main(argv: list[str]) -> int:
         )
         start_with = replacement
 
+    resumed_context: Optional[ContextManager] = None
+    if args.resume_context:
+        resume_path = Path(args.resume_context)
+        if resume_path.exists():
+            try:
+                resumed_context = load_context(resume_path, effective_history_size)
+            except (OSError, ValueError) as exc:
+                print(f"[error] Failed to load context from {resume_path}: {exc}", file=sys.stderr)
+                return 1
+        else:
+            print(f"[info] No saved context at {resume_path}; starting fresh.", file=sys.stderr)
+
     controllers: Dict[str, TmuxController] = {}
+    startup_errors: list[Exception] = []
 
-    try:
-        for agent in selected_agents:
-            display_name = AGENT_DISPLAY_NAMES[agent]
-            controller = build_controller(
+    # Selected agents start in parallel; every startup error is reported together below.
+    with ThreadPoolExecutor(max_workers=len(selected_agents)) as executor:
+        futures = {
+            agent: executor.submit(
+                build_controller,
                 agent_key=agent,
-                display_name=display_name,
+                display_name=AGENT_DISPLAY_NAMES[agent],
                 session_name=getattr(args, f"{agent}_session"),
                 executable=getattr(args, f"{agent}_executable"),
+                executable_parts=getattr(args, f"{agent}_executable_parts"),
                 working_dir=getattr(args, f"{agent}_cwd"),
                 auto_start=args.auto_start,
                 startup_timeout=getattr(args, f"{agent}_startup_timeout"),
@@ -451,42 +573,67 @@ def main(argv: list[str]) -> int:
                 bootstrap=getattr(args, f"{agent}_bootstrap"),
                 kill_existing=args.kill_existing,
             )
-            controllers[agent] = controller
-    except (SessionNotFoundError, SessionBackendError) as exc:
-        print(f"[error] {exc}", file=sys.stderr)
+            for agent in selected_agents
+        }
+        for agent, future in futures.items():
+            try:
+                controllers[agent] = future.result()
+            except (SessionNotFoundError, SessionBackendError) as exc:
+                startup_errors.append(exc)
+
+    if startup_errors:
+        for exc in startup_errors:
+            print(f"[error] {exc}", file=sys.stderr)
+        if args.cleanup_after:
+            cleanup_controllers(controllers)
         return 1
 
-    prompt_queue: Dict[str, list[str]] = {name: [] for name in controllers}
-    if args.group_system_prompt or args.group_system_prompt_file:
-        group_prompt = args.group_system_prompt or f"Read @{args.group_system_prompt_file}"
-        for prompts in prompt_queue.values():
-            prompts.append(group_prompt)
-
-    for ai_name, controller in controllers.items():
-        if controller is None:
-            continue
-
-        prompt_arg = getattr(args, f"{ai_name}_system_prompt", None)
-        file_arg = getattr(args, f"{ai_name}_system_prompt_file", None)
-        if prompt_arg or file_arg:
-            prompt_queue[ai_name].append(prompt_arg or f"Read @{file_arg}")
-
-    if any(prompts for prompts in prompt_queue.values()):
-        for name, controller in controllers.items():
+    has_any_prompt = bool(
+        args.group_system_prompt
+        or args.group_system_prompt_file
+        or any(
+            getattr(args, f"{agent}_system_prompt", None)
+            or getattr(args, f"{agent}_system_prompt_file", None)
+            for agent in selected_agents
+        )
+    )
+    prompt_queue: Dict[str, list[str]] = {}
+    if has_any_prompt:
+        prompt_queue = {name: [] for name in controllers}
+        if args.group_system_prompt or args.group_system_prompt_file:
+            group_prompt = args.group_system_prompt or f"Read @{args.group_system_prompt_file}"
+            for prompts in prompt_queue.values():
+                prompts.append(group_prompt)
+
+        for ai_name, controller in controllers.items():
             if controller is None:
                 continue
 
-            for prompt in prompt_queue[name]:
-                logger.info("Sending pre-discussion system prompt to %s", name)
-                try:
-                    controller.send_command(prompt)
-                    controller.wait_for_ready(timeout=30)
-                except Exception as exc:  # pylint: disable=broad-except
-                    print(
-                        f"[error] Failed to deliver pre-discussion prompt to {name}: {exc}",
-                        file=sys.stderr,
-                    )
-                    return 1
+            prompt_arg = getattr(args, f"{ai_name}_system_prompt", None)
+            file_arg = getattr(args, f"{ai_name}_system_prompt_file", None)
+            if prompt_arg or file_arg:
+                prompt_queue[ai_name].append(prompt_arg or f"Read @{file_arg}")
+
+    pending_prompts = {name: prompts for name, prompts in prompt_queue.items() if prompts}
+    if pending_prompts:
+        # Each controller receives its own queue as one message; queues for
+        # different controllers are independent, so their readiness waits overlap.
+        with ThreadPoolExecutor(max_workers=len(pending_prompts)) as executor:
+            deliveries = {
+                name: executor.submit(deliver_system_prompts, name, controllers[name], prompts)
+                for name, prompts in pending_prompts.items()
+            }
+        delivery_failed = False
+        for name, future in deliveries.items():
+            exc = future.exception()
+            if exc is not None:
+                print(
+                    f"[error] Failed to deliver pre-discussion prompt to {name}: {exc}",
+                    file=sys.stderr,
+                )
+                delivery_failed = True
+        if delivery_failed:
+            return 1
 
     try:
         result = run_discussion(
@@ -498,41 +645,82 @@ def main(argv: list[str]) -> int:
             debug_prompts=args.debug_prompts,
             debug_prompt_chars=args.debug_prompt_chars,
             include_history=include_history,
+            context_manager=resumed_context,
             participants=selected_agents,
         )
     finally:
         if args.cleanup_after:
-            for agent, controller in controllers.items():
-                cleanup_controller(controller, AGENT_DISPLAY_NAMES.get(agent, agent))
+            cleanup_controllers(controllers)
 
     conversation = result["conversation"]
     context_manager: ContextManager = result["context_manager"]
-
-    print("\n=== Conversation Transcript ===")
-    for turn in conversation:
-        print(format_turn(turn))
-        print("-")
-
-    print("\n=== Shared Context Summary ===")
     summary = context_manager.summarize_conversation(context_manager.history)
-    print(summary or "(no summary available)")
 
+    log_path: Optional[Path] = None
+    log_handle: Optional[TextIO] = None
     if args.log_file:
         log_path = Path(args.log_file)
-        if log_path.suffix:
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-        else:
-            log_path.mkdir(parents=True, exist_ok=True)
+        if log_path.is_dir():
             log_path = log_path / "discussion.log"
-
-        log_lines = ["=== Conversation Transcript ==="]
-        log_lines.extend(format_turn(turn) + "\n-" for turn in conversation)
-        log_lines.append("\n=== Shared Context Summary ===")
-        log_lines.append(summary or "(no summary available)")
-        log_path.write_text("\n".join(log_lines), encoding="utf-8")
+        # The log is only opened once the discussion has finished, so an aborted
+        # run leaves nothing behind; skip mkdir when the parent already exists.
+        try:
+            if not log_path.parent.is_dir():
+                log_path.parent.mkdir(parents=True, exist_ok=True)
+            log_handle = log_path.open("w", encoding="utf-8", newline="\n", buffering=1 << 16)
+        except OSError as exc:
+            print(f"[error] Failed to open log file {log_path}: {exc}", file=sys.stderr)
+    log_failed = log_path is not None and log_handle is None
+
+    def write_log(text: str) -> None:
+        # The log is a secondary sink: a failure drops it and stdout carries on.
+        nonlocal log_handle, log_failed
+        if log_handle is None:
+            return
+        try:
+            log_handle.write(text)
+        except OSError as exc:
+            print(f"[error] Failed to write log file {log_path}: {exc}", file=sys.stderr)
+            with suppress(OSError):
+                log_handle.close()
+            log_handle = None
+            log_failed = True
+
+    # Format each section once and write it to stdout and the log in one pass.
+    try:
+        write_log("=== Conversation Transcript ===\n")
+        sys.stdout.write("\n=== Conversation Transcript ===\n")
+        for turn in conversation:
+            block = f"{format_turn(turn)}\n-\n"
+            sys.stdout.write(block)
+            write_log(block)
+
+        closing = f"\n=== Shared Context Summary ===\n{summary or '(no summary available)'}"
+        sys.stdout.write(closing)
+        write_log(closing)
+        sys.stdout.write("\n")
+    finally:
+        if log_handle is not None:
+            try:
+                log_handle.close()
+            except OSError as exc:
+                print(f"[error] Failed to write log file {log_path}: {exc}", file=sys.stderr)
+                log_failed = True
+
+    exit_code = 1 if log_failed else 0
+    if log_path and not log_failed:
         print(f"\n[log] Conversation written to {log_path}")
 
-    return 0
+    # Saved last so a bad --save-context path never costs the transcript or log.
+    if args.save_context:
+        save_path = Path(args.save_context)
+        try:
+            save_context(context_manager, save_path)
+        except (OSError, TypeError, ValueError) as exc:
+            print(f"[error] Failed to save context to {save_path}: {exc}", file=sys.stderr)
+            exit_code = 1
+
+    return exit_code
 
 
 if __name__ == "__main__":
@@ -17,6 +17,7 @@ import logging
 import shlex
 import sys
 import textwrap
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence
@@ -199,6 +200,32 @@ def build_controller(
     return controller
 
 
+def abandon_startup(
+    future_agents: Dict[Future, str],
+    controllers: Dict[str, TmuxController],
+    *,
+    kill_sessions: bool,
+) -> None:
+    """
+    Unwind a failed concurrent startup the way the sequential one stopped.
+
+    Startups that have not begun are cancelled. The ones already running
+    cannot be interrupted, so they are waited on. Every session that came up
+    is then killed when ``kill_sessions`` is set (i.e., ``--auto-start`` may
+    have launched it); without it the sessions were already running and are
+    left alone.
+    """
+    for future in future_agents:
+        future.cancel()
+    for future, agent in future_agents.items():
+        if agent in controllers or future.cancelled() or future.exception() is not None:
+            continue
+        controllers[agent] = future.result()
+    if kill_sessions:
+        for agent, controller in controllers.items():
+            cleanup_controller(controller, agent.capitalize())
+
+
 def build_tmux_controllers(args) -> tuple[Dict[str, TmuxController], ParticipantMetadata]:
     controllers: Dict[str, TmuxController] = {}
     metadata: ParticipantMetadata = {
@@ -207,41 +234,32 @@ def build_tmux_controllers(args) -> tuple[Dict[str, TmuxController], Participant
         "codex": {"type": "cli", "role": "implementation"},
     }
 
-    controllers["claude"] = build_controller(
-        name="Claude",
-        session_name=args.claude_session,
-        executable=args.claude_executable,
-        working_dir=args.claude_cwd,
-        auto_start=args.auto_start,
-        startup_timeout=args.claude_startup_timeout,
-        init_wait=args.claude_init_wait,
-        bootstrap=args.claude_bootstrap,
-        kill_existing=args.kill_existing,
-    )
-    controllers["gemini"] = build_controller(
-        name="Gemini",
-        session_name=args.gemini_session,
-        executable=args.gemini_executable,
-        working_dir=args.gemini_cwd,
-        auto_start=args.auto_start,
-        startup_timeout=args.gemini_startup_timeout,
-        init_wait=args.gemini_init_wait,
-        bootstrap=args.gemini_bootstrap,
-        kill_existing=args.kill_existing,
-    )
-    controllers["codex"] = build_controller(
-        name="Codex",
-        session_name=args.codex_session,
-        executable=args.codex_executable,
-        working_dir=args.codex_cwd,
-        auto_start=args.auto_start,
-        startup_timeout=args.codex_startup_timeout,
-        init_wait=args.codex_init_wait,
-        bootstrap=args.codex_bootstrap,
-        kill_existing=args.kill_existing,
-    )
-
-    return controllers, metadata
+    # Claude, Gemini and Codex boot independently, so wait on all three at once.
+    with ThreadPoolExecutor(max_workers=len(metadata)) as executor:
+        future_agents = {
+            executor.submit(
+                build_controller,
+                name=agent.capitalize(),
+                session_name=getattr(args, f"{agent}_session"),
+                executable=getattr(args, f"{agent}_executable"),
+                working_dir=getattr(args, f"{agent}_cwd"),
+                auto_start=args.auto_start,
+                startup_timeout=getattr(args, f"{agent}_startup_timeout"),
+                init_wait=getattr(args, f"{agent}_init_wait"),
+                bootstrap=getattr(args, f"{agent}_bootstrap"),
+                kill_existing=args.kill_existing,
+            ): agent
+            for agent in metadata
+        }
+        try:
+            for future in as_completed(future_agents):
+                controllers[future_agents[future]] = future.result()
+        except Exception:
+            abandon_startup(future_agents, controllers, kill_sessions=args.auto_start)
+            raise
+
+    # Startups finish in any order; keep the declared participant order.
+    return {agent: controllers[agent] for agent in metadata}, metadata
 
 
 # --------------------------------------------------------------------------- #
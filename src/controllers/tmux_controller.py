@@ -229,6 +229,16 @@ class TmuxController(SessionBackend):
         result = self._run_tmux_command(["has-session", "-t", self.session_name])
         return result.returncode == 0
 
+    def _raise_if_session_missing(self, result: subprocess.CompletedProcess) -> None:
+        """
+        Raise SessionNotFoundError when a failed command was due to a missing session.
+
+        Queries and kill-session run first and only check has-session on failure,
+        which keeps polling loops and teardown to one tmux subprocess per call.
+        """
+        if result.returncode != 0 and not self.session_exists():
+            raise SessionNotFoundError(f"Session '{self.session_name}' does not exist")
+
     # ========================================================================
     # Automation / Manual Takeover Helpers
     # ========================================================================
@@ -646,17 +656,15 @@ class TmuxController(SessionBackend):
             Tmux's -S flag uses top-relative indexing where 0 is the first line
             in the scrollback. Use negative values to offset from the top.
         """
-        if not self.session_exists():
-            raise SessionNotFoundError(f"Session '{self.session_name}' does not exist")
-
         try:
             args = ["capture-pane", "-t", self.session_name, "-p"]
             if start_line is not None:
                 args.extend(["-S", str(start_line)])
             result = self._run_tmux_command(args)
-            return result.stdout
         except TmuxError as e:
             raise SessionBackendError(f"Failed to capture output: {e}") from e
+        self._raise_if_session_missing(result)
+        return result.stdout
 
     def capture_scrollback(self) -> str:
         """
@@ -669,16 +677,62 @@ class TmuxController(SessionBackend):
             SessionNotFoundError: If the session does not exist.
             SessionBackendError: If the backend cannot capture output.
         """
-        if not self.session_exists():
-            raise SessionNotFoundError(f"Session '{self.session_name}' does not exist")
-
         try:
             result = self._run_tmux_command([
                 "capture-pane", "-t", self.session_name, "-p", "-S", "-"
             ])
-            return result.stdout
         except TmuxError as e:
             raise SessionBackendError(f"Failed to capture scrollback: {e}") from e
+        self._raise_if_session_missing(result)
+        return result.stdout
+
+    def scrollback_length(self) -> Optional[int]:
+        """
+        Return the number of lines currently held in the pane history.
+
+        History lines sit above the visible pane and are addressed with negative
+        ``start_line`` offsets in capture_output(). Remember this value before a
+        command to later capture only the region that may have changed.
+
+        Once the history reaches tmux's ``history-limit``, tmux drops a tenth of
+        the limit from the top and the size stops growing with new output, so
+        offsets taken from it no longer line up. The length is reported as None
+        from the point where such a trim can happen; callers should then fall
+        back to a full capture_scrollback().
+
+        Returns:
+            Number of history lines (tmux ``#{history_size}``), or None when the
+            history is at or near ``#{history_limit}``.
+
+        Raises:
+            SessionNotFoundError: If the session does not exist.
+            SessionBackendError: If tmux cannot report the history size.
+        """
+        try:
+            result = self._run_tmux_command([
+                "display-message", "-p", "-t", self.session_name,
+                "#{history_size} #{history_limit}"
+            ])
+        except TmuxError as e:
+            raise SessionBackendError(f"Failed to query scrollback length: {e}") from e
+        self._raise_if_session_missing(result)
+
+        try:
+            size_text, limit_text = result.stdout.split()
+            size, limit = int(size_text), int(limit_text)
+        except ValueError as e:
+            # display-message can succeed with empty output for an unknown target.
+            if not self.session_exists():
+                raise SessionNotFoundError(
+                    f"Session '{self.session_name}' does not exist"
+                ) from None
+            raise SessionBackendError(
+                f"Unexpected history_size output: {result.stdout!r}"
+            ) from e
+
+        if limit and size >= limit - max(limit // 10, 1):
+            return None
+        return size
 
     def list_clients(self) -> Sequence[str]:
         """
@@ -740,17 +794,15 @@ class TmuxController(SessionBackend):
         Raises:
             SessionNotFoundError: If no session exists to terminate.
         """
-        if not self.session_exists():
-            raise SessionNotFoundError(f"Session '{self.session_name}' does not exist")
-
         try:
             result = self._run_tmux_command([
                 "kill-session", "-t", self.session_name
             ])
-            if result.returncode != 0:
-                raise SessionBackendError(f"Failed to kill session: {result.stderr}")
         except TmuxError as e:
             raise SessionBackendError(f"Failed to kill session: {e}") from e
+        if result.returncode != 0:
+            self._raise_if_session_missing(result)
+            raise SessionBackendError(f"Failed to kill session: {result.stderr}")
 
     def get_status(self) -> Mapping[str, object]:
         """
@@ -10,7 +10,7 @@ from __future__ import annotations
 
 import re
 from collections import deque
-from typing import Any, Deque, Dict, List, Optional, Sequence, Set, Tuple
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Set, Tuple
 
 from ..utils.logger import get_logger
 from ..utils.output_parser import OutputParser, ParsedOutput
@@ -93,10 +93,22 @@ class ConversationManager:
     # Public API
     # ------------------------------------------------------------------ #
 
-    def facilitate_discussion(self, topic: str, max_turns: int = 10) -> List[Dict[str, Any]]:
+    def facilitate_discussion(
+        self,
+        topic: str,
+        max_turns: int = 10,
+        *,
+        on_turn: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Run a short turn-based discussion around ``topic``.
 
+        Args:
+            topic: Subject for the conversation.
+            max_turns: Maximum number of turns before stopping.
+            on_turn: Optional callback invoked with each completed turn record
+                so callers can stream output instead of waiting for the full run.
+
         Returns:
             Ordered list of turn dictionaries. Each entry includes:
                 - turn (int): Absolute turn index.
@@ -152,6 +164,12 @@ class ConversationManager:
             self._record_with_context_manager(turn_record)
             self._route_message(turn_record, topic, dispatched=not is_queued)
 
+            if on_turn is not None:
+                try:
+                    on_turn(turn_record)
+                except Exception as exc:  # noqa: BLE001
+                    self.logger.warning("on_turn callback failed for turn %s: %s", turn_record["turn"], exc)
+
             # Give the orchestrator a chance to drain any newly runnable work.
             try:
                 self.orchestrator.tick()
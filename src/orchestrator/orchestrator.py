@@ -11,7 +11,7 @@ top of a stable contract.
 from __future__ import annotations
 
 from collections import deque
-from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from ..utils.logger import get_logger
 
@@ -287,6 +287,7 @@ class DevelopmentTeamOrchestrator:
         context_manager: Any | None = None,
         message_router: Any | None = None,
         include_history: bool = True,
+        on_turn: Optional[Callable[[Dict[str, Any]], None]] = None,
     ) -> Dict[str, Any]:
         """
         Run a facilitated discussion between registered controllers.
@@ -300,6 +301,8 @@ class DevelopmentTeamOrchestrator:
                 ContextManager is created.
             message_router: Optional message router instance. A default router
                 is created when not provided.
+            on_turn: Optional callback invoked with each turn as soon as it
+                completes (see ConversationManager.facilitate_discussion).
 
         Returns:
             Dict containing:
@@ -346,7 +349,7 @@ class DevelopmentTeamOrchestrator:
             participant_metadata=participant_metadata or None,
             include_history=include_history,
         )
-        conversation = manager.facilitate_discussion(topic, max_turns=max_turns)
+        conversation = manager.facilitate_discussion(topic, max_turns=max_turns, on_turn=on_turn)
         return {
             "conversation": conversation,
             "manager": manager,
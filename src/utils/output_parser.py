@@ -54,10 +54,12 @@ class OutputParser:
     )
 
     # Claude Code UI patterns
-    PROMPT_PATTERN = r'^>\s'
-    SEPARATOR_PATTERN = r'^─+$'
-    STATUS_LINE_PATTERN = r'\? for shortcuts.*Thinking (on|off)'
-    HEADER_PATTERN = r'▐▛███▜▌.*Claude Code'
+    PROMPT_PATTERN = re.compile(r'^>\s')
+    SEPARATOR_PATTERN = re.compile(r'^─+$')
+    STATUS_LINE_PATTERN = re.compile(r'\? for shortcuts.*Thinking (on|off)')
+    HEADER_PATTERN = re.compile(r'▐▛███▜▌.*Claude Code')
+    HEADER_TOKENS = ('▐▛███▜▌', '▝▜█████▛▘', '▘▘ ▝▝', '███')
+    ERROR_PATTERN = re.compile(r'error|failed|cannot|unable to|not found|invalid')
 
     def __init__(self):
         """Initialize OutputParser."""
@@ -128,11 +130,11 @@ class OutputParser:
             stripped = inner
 
         # Skip header lines (Claude and Gemini art/logos)
-        if any(token in stripped for token in ['▐▛███▜▌', '▝▜█████▛▘', '▘▘ ▝▝', '███']):
+        if any(token in stripped for token in self.HEADER_TOKENS):
             return None
 
         # Skip broad separator or border lines
-        if re.match(self.SEPARATOR_PATTERN, stripped):
+        if self.SEPARATOR_PATTERN.match(stripped):
             return None
         if self.GEMINI_BOX_BORDER_PATTERN.match(stripped):
             return None
@@ -140,13 +142,13 @@ class OutputParser:
             return None
 
         # Skip prompt-only placeholders and pasted text markers
-        if re.match(self.PROMPT_PATTERN, stripped) and len(stripped) <= 2:
+        if self.PROMPT_PATTERN.match(stripped) and len(stripped) <= 2:
             return None
         if self.PROMPT_PASTED_PATTERN.match(stripped):
             return None
 
         # Skip known status/permission lines
-        if re.search(self.STATUS_LINE_PATTERN, stripped):
+        if self.STATUS_LINE_PATTERN.search(stripped):
             return None
         if self.PERMISSION_PROMPT_PATTERN.match(stripped):
             return None
@@ -263,8 +265,8 @@ class OutputParser:
 
             # Skip UI elements
             if (not stripped or
-                re.match(self.SEPARATOR_PATTERN, stripped) or
-                re.search(self.STATUS_LINE_PATTERN, stripped) or
+                self.SEPARATOR_PATTERN.match(stripped) or
+                self.STATUS_LINE_PATTERN.search(stripped) or
                 any(char in line for char in ['▐▛███▜▌', '▝▜█████▛▘'])):
                 # End of response
                 if in_response:
@@ -447,17 +449,7 @@ class OutputParser:
         Returns:
             True if error detected, False otherwise
         """
-        error_patterns = [
-            r'error',
-            r'failed',
-            r'cannot',
-            r'unable to',
-            r'not found',
-            r'invalid',
-        ]
-
-        text_lower = text.lower()
-        return any(re.search(pattern, text_lower) for pattern in error_patterns)
+        return self.ERROR_PATTERN.search(text.lower()) is not None
 
     def format_conversation(self, text: str) -> str:
         """
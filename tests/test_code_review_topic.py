@@ -1,10 +1,16 @@
+import os
 from pathlib import Path
 
 import pytest
 
 from examples.run_code_review_simulation import (
+    DEFAULT_TURN_PLAN,
     InclusionStrategy,
+    ReviewContextManager,
+    _count_lines,
     _format_display_path,
+    _load_snippet,
+    _write_all,
     build_topic,
     determine_inclusion_strategy,
 )
@@ -71,7 +77,7 @@ def test_build_topic_embed_includes_code(snippet_path: Path):
         preview_lines=5,
     )
     display_path = _format_display_path(snippet_path)
-    assert "```python" in topic
+    assert "directly in your CLI):\n```python\n    print('hello')" in topic
     assert "print('hello')" in topic
     assert f"@{display_path}" in topic
 
@@ -101,3 +107,70 @@ def test_build_topic_reference_only_has_no_code_block(snippet_path: Path):
     )
     assert "```python" not in topic
     assert f"@{_format_display_path(snippet_path)}" in topic
+
+
+def test_build_topic_default_plan_matches_custom_plan_layout(snippet_path: Path):
+    lines = ["print('hello')"]
+    kwargs = {"strategy": InclusionStrategy.EMBED_FULL, "preview_lines": 5}
+    default_topic = build_topic(snippet_path, DEFAULT_TURN_PLAN, lines, **kwargs)
+    # A distinct string object forces the generic assembly path.
+    custom_topic = build_topic(snippet_path, f"{DEFAULT_TURN_PLAN}\n", lines, **kwargs)
+    assert default_topic == custom_topic
+
+
+def test_load_snippet_reuses_cached_read_until_mtime_changes(snippet_path: Path):
+    mtime_ns = snippet_path.stat().st_mtime_ns
+    text, size = _load_snippet(str(snippet_path), mtime_ns)
+    assert text == "print('hello')\nprint('world')\nprint('!')"
+    assert size == snippet_path.stat().st_size
+
+    snippet_path.write_text("print('changed')\n", encoding="utf-8")
+    assert _load_snippet(str(snippet_path), mtime_ns)[0] == text
+
+    refreshed = _load_snippet(str(snippet_path), mtime_ns + 1)
+    assert refreshed[0] == "print('changed')"
+
+
+def test_load_snippet_normalizes_windows_newlines(tmp_path: Path):
+    path = tmp_path / "crlf.py"
+    path.write_bytes(b"a = 1\r\nb = 2\r\n")
+    text, size = _load_snippet(str(path), path.stat().st_mtime_ns)
+    assert text == "a = 1\nb = 2"
+    assert size == 14
+
+
+def test_count_lines_matches_splitlines():
+    for text in ("", "one", "one\ntwo", "one\n\nthree"):
+        assert _count_lines(text) == len(text.splitlines())
+
+
+def test_count_lines_only_breaks_on_newline():
+    # Form feeds and similar separators stay inside the line they appear on.
+    text = "import os\n\x0c\ndef main():\x0b    pass\u2028x = 1"
+    assert _count_lines(text) == len(text.split("\n")) == 3
+
+
+def test_review_context_sends_scenario_once_per_participant():
+    manager = ReviewContextManager("SCENARIO")
+
+    assert "SCENARIO" in manager.build_prompt("claude", "review")
+    manager.record_turn({"turn": 0, "speaker": "claude", "response": "Found an off-by-one."})
+
+    assert "SCENARIO" in manager.build_prompt("gemini", "review")
+    manager.record_turn({"turn": 1, "speaker": "gemini", "response": "Empty ranges crash."})
+
+    follow_up = manager.build_prompt("claude", "review")
+    assert "SCENARIO" not in follow_up
+    assert "gemini: Empty ranges crash." in follow_up
+
+
+def test_write_all_retries_short_writes(tmp_path: Path, monkeypatch):
+    real_write = os.write
+    monkeypatch.setattr(os, "write", lambda fd, data: real_write(fd, bytes(data[:3])))
+    path = tmp_path / "transcript.log"
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT)
+    try:
+        _write_all(fd, b"complete transcript")
+    finally:
+        os.close(fd)
+    assert path.read_bytes() == b"complete transcript"
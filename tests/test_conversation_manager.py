@@ -378,3 +378,19 @@ def test_orchestrator_start_discussion_with_router() -> None:
         base_prompt="[Reminder]",
     )
     assert "[Reminder]" in prompt
+
+
+def test_facilitate_discussion_streams_turns_to_callback() -> None:
+    claude_controller = FakeConversationalController(["First idea.", "Consensus: ship it."])
+    gemini_controller = FakeConversationalController(["Second idea."])
+    orchestrator = DevelopmentTeamOrchestrator(
+        {"claude": claude_controller, "gemini": gemini_controller}
+    )
+    manager = ConversationManager(orchestrator, ["claude", "gemini"])
+
+    streamed: List[Dict[str, Any]] = []
+    conversation = manager.facilitate_discussion("Plan release", max_turns=4, on_turn=streamed.append)
+
+    assert [turn["speaker"] for turn in streamed] == ["claude", "gemini", "claude"]
+    assert streamed == conversation
+    assert streamed[-1]["metadata"]["consensus"] is True
@@ -0,0 +1,109 @@
+import json
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from examples.run_orchestrated_discussion import (
+    deliver_system_prompts,
+    load_context,
+    parse_args,
+    save_context,
+)
+from src.orchestrator import ContextManager
+
+
+class RecordingController:
+    """Captures submissions and readiness waits instead of driving tmux."""
+
+    def __init__(self) -> None:
+        self.sent: List[str] = []
+        self.timeouts: List[int] = []
+
+    def send_command(self, command: str) -> bool:
+        self.sent.append(command)
+        return True
+
+    def wait_for_ready(self, timeout: int) -> bool:
+        self.timeouts.append(timeout)
+        return True
+
+
+def test_deliver_system_prompts_sends_single_prompt_unchanged():
+    controller = RecordingController()
+    deliver_system_prompts("claude", controller, ["Read @docs/brief.md"])
+    assert controller.sent == ["Read @docs/brief.md"]
+    assert controller.timeouts == [30]
+
+
+def test_deliver_system_prompts_keeps_combined_prompts_distinct():
+    controller = RecordingController()
+    deliver_system_prompts(
+        "claude",
+        controller,
+        ["You are reviewing a patch", "Read @docs/brief.md", "Be concise!"],
+    )
+    # send_command flattens newlines, so each prompt must end its own sentence.
+    assert controller.sent == ["You are reviewing a patch. Read @docs/brief.md . Be concise!"]
+    assert controller.timeouts == [90]
+
+
+def test_saved_context_round_trips_into_resumed_prompts(tmp_path: Path):
+    original = ContextManager(history_size=5)
+    original.record_turn(
+        {
+            "turn": 0,
+            "speaker": "claude",
+            "response": "Split the parser.",
+            "metadata": {"path": Path("a.py")},
+        }
+    )
+    original.record_turn({"turn": 1, "speaker": "gemini", "response": "Add tests first."})
+    # Within the original run Claude's own earlier turn is filtered from its context.
+    assert "claude: Split the parser." not in original.build_prompt("claude", "refactor")
+
+    path = tmp_path / "nested" / "context.json"
+    save_context(original, path)
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert saved[0]["metadata"] == {"path": "a.py"}
+
+    resumed = load_context(path, history_size=5)
+    assert [turn["speaker"] for turn in resumed.history] == ["claude", "gemini"]
+    assert all("turn" not in turn for turn in resumed.history)
+    # Turn numbers restart in the new run, so resumed turns stay visible to everyone.
+    prompt = resumed.build_prompt("claude", "refactor")
+    assert "Recent context: claude: Split the parser.; gemini: Add tests first." in prompt
+
+
+def test_load_context_skips_non_dict_entries(tmp_path: Path):
+    path = tmp_path / "context.json"
+    path.write_text(json.dumps(["stray", {"speaker": "qwen", "response": "ok"}]), encoding="utf-8")
+    assert load_context(path, history_size=5).history == [{"speaker": "qwen", "response": "ok"}]
+
+
+def test_load_context_rejects_non_list_json(tmp_path: Path):
+    path = tmp_path / "context.json"
+    path.write_text(json.dumps({"speaker": "claude"}), encoding="utf-8")
+    with pytest.raises(ValueError, match="expected a JSON list of turns"):
+        load_context(path, history_size=5)
+
+
+def test_parse_args_tokenizes_only_selected_executables():
+    args = parse_args(
+        [
+            "topic",
+            "--agents",
+            "claude",
+            "--claude-executable",
+            "claude --flag 'a b'",
+            "--qwen-executable",
+            'qwen "unterminated',
+        ]
+    )
+    assert args.claude_executable_parts == ("claude", "--flag", "a b")
+    assert not hasattr(args, "qwen_executable_parts")
+
+
+def test_parse_args_rejects_malformed_selected_executable():
+    with pytest.raises(SystemExit):
+        parse_args(["topic", "--agents", "qwen", "--qwen-executable", 'qwen "unterminated'])
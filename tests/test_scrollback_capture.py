@@ -0,0 +1,114 @@
+from typing import List, Optional
+
+from examples.run_controller_probe import capture_lines_since
+from examples.run_counting_conversation import capture_text_since, scrollback_mark
+from src.controllers.tmux_controller import TmuxController
+
+
+class FakeResult:
+    def __init__(self, returncode: int = 0, stdout: str = "", stderr: str = ""):
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+
+
+class FakeHistoryController(TmuxController):
+    """Reports a fixed history size/limit pair instead of querying tmux."""
+
+    def __init__(self, history_size: int, history_limit: int):
+        self.history_size = history_size
+        self.history_limit = history_limit
+        self.captures: List[object] = []
+        super().__init__(session_name="fake-session", executable="fake-cli", working_dir="/tmp")
+
+    def _verify_environment(self):
+        return
+
+    def session_exists(self) -> bool:
+        return True
+
+    def _run_tmux_command(self, args):
+        if args and args[0] == "display-message":
+            return FakeResult(stdout=f"{self.history_size} {self.history_limit}\n")
+        return FakeResult()
+
+    def capture_output(self, *, start_line: Optional[int] = None, lines: Optional[int] = None) -> str:
+        self.captures.append(start_line)
+        return "visible"
+
+    def capture_scrollback(self) -> str:
+        self.captures.append("full")
+        return "history\nvisible"
+
+
+class FakePane:
+    """Pane stub recording which capture path the helpers take."""
+
+    def __init__(self, history_size: Optional[int]):
+        self.history_size = history_size
+        self.length_queries = 0
+        self.captures: List[object] = []
+
+    def scrollback_length(self) -> Optional[int]:
+        self.length_queries += 1
+        return self.history_size
+
+    def capture_output(self, start_line: int) -> str:
+        self.captures.append(start_line)
+        return "visible"
+
+    def capture_scrollback(self) -> str:
+        self.captures.append("full")
+        return "history\nvisible"
+
+
+def test_scrollback_length_reports_history_size_below_limit():
+    assert FakeHistoryController(1200, 2000).scrollback_length() == 1200
+
+
+def test_scrollback_length_is_none_once_history_can_be_trimmed():
+    # tmux trims limit // 10 lines at a time, so a saturated history hovers
+    # between 90% and 100% of the limit.
+    assert FakeHistoryController(1800, 2000).scrollback_length() is None
+    assert FakeHistoryController(48, 50).scrollback_length() is None
+    assert FakeHistoryController(44, 50).scrollback_length() == 44
+
+
+def test_probe_capture_uses_bounded_region_when_history_tracks_output():
+    pane = FakePane(history_size=12)
+    assert capture_lines_since(pane, 10) == ["visible"]
+    assert pane.captures == [-2]
+
+
+def test_probe_capture_falls_back_to_full_scrollback_when_saturated():
+    pane = FakePane(history_size=None)
+    assert capture_lines_since(pane, 10) == ["history", "visible"]
+    assert pane.captures == ["full"]
+
+
+def test_probe_capture_reuses_known_history_length():
+    pane = FakePane(history_size=10)
+    capture_lines_since(pane, 10, current=10)
+    assert pane.length_queries == 0
+    assert pane.captures == [0]
+
+
+def test_counting_capture_is_bounded_while_history_grows():
+    controller = FakeHistoryController(history_size=40, history_limit=50)
+    mark = scrollback_mark(controller)
+    controller.history_size = 43
+    assert capture_text_since(controller, mark) == ("visible", 43)
+    assert controller.captures == [-3]
+
+
+def test_counting_capture_resyncs_when_history_saturates():
+    controller = FakeHistoryController(history_size=40, history_limit=50)
+    mark = scrollback_mark(controller)
+    # ~30 new lines at the limit: tmux trims, so the size barely moves.
+    controller.history_size = 48
+    text, current = capture_text_since(controller, mark)
+    assert (text, current) == ("history\nvisible", None)
+    assert controller.captures == ["full"]
+    # With no usable mark the next turn keeps using full captures.
+    assert scrollback_mark(controller) is None
+    assert capture_text_since(controller, None) == ("history\nvisible", None)